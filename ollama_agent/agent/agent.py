@@ -22,6 +22,7 @@ from openai.types.shared import Reasoning
 from ..memory import configure_mem0
 from ..settings.configini import Mem0Settings, load_instructions
 from ..settings.mcp import RunningMCPServer, cleanup_mcp_servers, initialize_mcp_servers
+from ..streaming import StreamEvent
 from .tools import execute_command, mem0_add_memory, mem0_search_memory
 from ..utils import (
     ModelCapabilityError,
@@ -32,28 +33,32 @@ from ..utils import (
 from .session_manager import SessionManager
 
 logger = logging.getLogger(__name__)
+_TOOL_OUTPUT_PREVIEW_LENGTH = 100
 
 
-def _raw_event_payloads(data: Any) -> Iterable[dict[str, Any]]:
+def _raw_event_payloads(data: Any) -> Iterable[StreamEvent]:
     if isinstance(data, ResponseReasoningTextDeltaEvent) and data.delta:
-        yield {"type": "reasoning_delta", "content": data.delta}
+        yield StreamEvent("reasoning_delta", content=data.delta)
     elif isinstance(data, ResponseTextDeltaEvent) and data.delta:
-        yield {"type": "text_delta", "content": data.delta}
+        yield StreamEvent("text_delta", content=data.delta)
 
 
-def _item_event_payloads(item: Any) -> Iterable[dict[str, Any]]:
+def _item_event_payloads(item: Any) -> Iterable[StreamEvent]:
     item_type = getattr(item, "type", "")
     if item_type == "tool_call_item":
-        yield {"type": "tool_call", "name": getattr(item, "name", "unknown")}
+        yield StreamEvent("tool_call", name=getattr(item, "name", "unknown"))
     elif item_type == "tool_call_output_item":
-        yield {"type": "tool_output", "output": str(getattr(item, "output", ""))}
+        output = str(getattr(item, "output", ""))
+        if len(output) > _TOOL_OUTPUT_PREVIEW_LENGTH:
+            output = f"{output[:_TOOL_OUTPUT_PREVIEW_LENGTH]}..."
+        yield StreamEvent("tool_output", output_preview=output)
     elif item_type == "reasoning":
         summary = getattr(item, "summary", "")
         if summary:
-            yield {"type": "reasoning_summary", "content": summary}
+            yield StreamEvent("reasoning_summary", content=summary)
 
 
-def _event_payloads(event: Any) -> Iterable[dict[str, Any]]:
+def _event_payloads(event: Any) -> Iterable[StreamEvent]:
     event_type = getattr(event, "type", "")
     if event_type == "raw_response_event":
         yield from _raw_event_payloads(getattr(event, "data", None))
@@ -61,7 +66,7 @@ def _event_payloads(event: Any) -> Iterable[dict[str, Any]]:
         yield from _item_event_payloads(getattr(event, "item", None))
     elif event_type == "agent_updated_stream_event":
         agent_name = getattr(getattr(event, "new_agent", None), "name", "unknown")
-        yield {"type": "agent_update", "name": agent_name}
+        yield StreamEvent("agent_update", name=agent_name)
 
 
 @dataclass(slots=True)
@@ -195,12 +200,12 @@ class OllamaAgent:
         prompt: str,
         model: Optional[str] = None,
         reasoning_effort: Optional[str] = None,
-    ) -> AsyncGenerator[dict[str, Any], None]:
+    ) -> AsyncGenerator[StreamEvent, None]:
         try:
             agent = await self._get_agent(model, reasoning_effort)
         except ModelCapabilityError as exc:
             logger.error("Model capability error for streamed execution: %s", exc)
-            yield {"type": "error", "content": str(exc)}
+            yield StreamEvent("error", content=str(exc))
             return
         try:
             result = Runner.run_streamed(
@@ -210,7 +215,7 @@ class OllamaAgent:
                     yield payload
         except Exception as exc:  # noqa: BLE001
             logger.error("Error running streamed agent: %s", exc)
-            yield {"type": "error", "content": str(exc)}
+            yield StreamEvent("error", content=str(exc))
 
     def reset_session(self) -> str:
         return self.session_manager.reset_session()
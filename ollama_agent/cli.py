@@ -2,7 +2,7 @@
 
 import argparse
 import asyncio
-from typing import Any, Callable, Optional
+from typing import Callable, Optional
 
 from rich.console import Console
 from rich.live import Live
@@ -11,7 +11,7 @@ from rich.table import Table
 
 from .agent import OllamaAgent
 from .tasks import Task, TaskManager
-from .streaming import EventHandler, stream_agent_events
+from .streaming import EventHandler, StreamEvent, stream_agent_events
 from .utils import ALLOWED_REASONING_EFFORTS
 
 
@@ -38,10 +38,10 @@ class _StreamingConsole:
             "tool_output": self._on_tool_output,
         }
 
-    def on_error(self, event: dict[str, Any]) -> None:
+    def on_error(self, event: StreamEvent) -> None:
         self._stop_live()
         self.console.print(
-            f"\n[red]❌ Error: {event.get('content', 'Unknown error')}[/red]"
+            f"\n[red]❌ Error: {event.content or 'Unknown error'}[/red]"
         )
 
     def _start_live(self) -> None:
@@ -64,31 +64,30 @@ class _StreamingConsole:
             self._reasoning = False
             self.console.print()
 
-    def _on_text_delta(self, event: dict[str, Any]) -> None:
+    def _on_text_delta(self, event: StreamEvent) -> None:
         self._conclude_reasoning()
         self._ensure_agent_banner()
         self._start_live()
-        self._text.append(event.get("content", ""))
+        self._text.append(event.content)
         self.live.update(Markdown("".join(self._text)))
 
-    def _on_reasoning_delta(self, event: dict[str, Any]) -> None:
+    def _on_reasoning_delta(self, event: StreamEvent) -> None:
         if not self._reasoning:
             self._stop_live()
             self.console.print("\n[bold magenta]🧠 Thinking:[/bold magenta] ", end="")
             self._reasoning = True
-        self.console.print(event.get("content", ""), end="", style="dim italic magenta")
+        self.console.print(event.content, end="", style="dim italic magenta")
 
-    def _on_tool_call(self, event: dict[str, Any]) -> None:
+    def _on_tool_call(self, event: StreamEvent) -> None:
         self._conclude_reasoning()
         self._stop_live()
         self.console.print(
-            f"\n[yellow]🔧 Calling tool: {event.get('name', 'unknown')}[/yellow]"
+            f"\n[yellow]🔧 Calling tool: {event.name or 'unknown'}[/yellow]"
         )
 
-    def _on_tool_output(self, event: dict[str, Any]) -> None:
+    def _on_tool_output(self, event: StreamEvent) -> None:
         self._stop_live()
-        output = event.get("output", "")
-        preview = f"{output[:100]}..." if len(output) > 100 else output
+        preview = event.output_preview
         self.console.print(f"[cyan]📤 Tool output: {preview}[/cyan]\n")
 
 
@@ -118,6 +117,11 @@ def create_argument_parser() -> argparse.ArgumentParser:
         type=int,
         help="Set built-in tool execution timeout in seconds"
     )
+    parser.add_argument(
+        "--scrollback",
+        type=int,
+        help="Maximum number of lines kept in the TUI chat log"
+    )
 
     # Task management subcommands
     subparsers = parser.add_subparsers(
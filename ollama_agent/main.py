@@ -58,7 +58,12 @@ def main() -> None:
     if not handle_cli_commands(args, create_agent):
         # If no CLI command was handled, start the TUI
         agent = create_agent(model=args.model, reasoning_effort=args.effort)
-        ChatInterface(agent, builtin_tool_timeout=builtin_tool_timeout).run()
+        scrollback = args.scrollback if args.scrollback is not None else cfg.scrollback
+        ChatInterface(
+            agent,
+            builtin_tool_timeout=builtin_tool_timeout,
+            scrollback=scrollback,
+        ).run()
 
 
 if __name__ == "__main__":
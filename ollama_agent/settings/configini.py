@@ -79,6 +79,7 @@ class Config:
     reasoning_effort: str = "medium"
     database_path: Path = field(default_factory=lambda: DEFAULT_DATABASE_PATH)
     builtin_tool_timeout: int = 30
+    scrollback: int = 5000
     mcp_config_path: Path = field(default_factory=lambda: DEFAULT_MCP_CONFIG_PATH)
     mem0: Mem0Settings = field(default_factory=Mem0Settings)
 
@@ -102,6 +103,7 @@ def _write_default_config(path: Path, defaults: Config) -> None:
         "reasoning_effort": defaults.reasoning_effort,
         "database_path": str(defaults.database_path),
         "builtin_tool_timeout": str(defaults.builtin_tool_timeout),
+        "scrollback": str(defaults.scrollback),
         "mcp_config_path": str(defaults.mcp_config_path),
     }
 
@@ -183,6 +185,12 @@ def get_config(config_dir: Path | None = None) -> Config:
             defaults.builtin_tool_timeout,
             "default.builtin_tool_timeout",
         ),
+        scrollback=_coerce(
+            _get("scrollback", str(defaults.scrollback)),
+            int,
+            defaults.scrollback,
+            "default.scrollback",
+        ),
         mcp_config_path=Path(_get("mcp_config_path", str(defaults.mcp_config_path))),
         mem0=mem0,
     )
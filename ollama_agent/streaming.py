@@ -2,11 +2,22 @@
 
 from __future__ import annotations
 
-from typing import Any, Callable, Iterable
+from typing import TYPE_CHECKING, Callable, Iterable, NamedTuple
 
-from .agent import OllamaAgent
+if TYPE_CHECKING:
+    from .agent import OllamaAgent
 
-EventHandler = Callable[[dict[str, Any]], None]
+
+class StreamEvent(NamedTuple):
+    """Single event yielded by ``OllamaAgent.run_async_streamed``."""
+
+    type: str
+    content: str = ""
+    name: str = ""
+    output_preview: str = ""
+
+
+EventHandler = Callable[[StreamEvent], None]
 
 
 async def stream_agent_events(
@@ -16,28 +27,29 @@ async def stream_agent_events(
     *,
     model: str | None = None,
     reasoning_effort: str | None = None,
-    on_error: Callable[[dict[str, Any]], None] | None = None,
+    on_error: EventHandler | None = None,
     ignore: Iterable[str] | None = None,
 ) -> None:
     """Dispatch streamed agent events to the provided handlers."""
 
-    ignored = set(ignore or ())
+    ignored = {"error", *(ignore or ())}
+    dispatch = {
+        event_type: handler
+        for event_type, handler in handlers.items()
+        if event_type not in ignored
+    }
 
     async for event in agent.run_async_streamed(
         prompt,
         model=model,
         reasoning_effort=reasoning_effort,
     ):
-        event_type = event.get("type")
+        event_type = event.type
 
-        if event_type == "error":
+        handler = dispatch.get(event_type)
+        if handler is not None:
+            handler(event)
+        elif event_type == "error":
             if on_error:
                 on_error(event)
             break
-
-        if not isinstance(event_type, str) or event_type in ignored:
-            continue
-
-        handler = handlers.get(event_type)
-        if handler:
-            handler(event)
@@ -1,9 +1,13 @@
 """Terminal user interface (TUI) using Textual."""
 
-from typing import Optional
+import asyncio
+import time
+from typing import TYPE_CHECKING, Optional
 
 from rich.markdown import Markdown as RichMarkdown
+from rich.style import Style
 from rich.text import Text
+from textual import events
 from textual.app import App, ComposeResult
 from textual.binding import Binding
 from textual.containers import Container, Vertical
@@ -11,13 +15,27 @@ from textual.widgets import Footer, Header, Input, RichLog
 
 from ..agent import OllamaAgent
 from ..agent.tools import set_builtin_tool_timeout
-from ..streaming import stream_agent_events
+from ..streaming import StreamEvent, stream_agent_events
 from ..tasks import Task, TaskManager
 from ..utils import extract_text
-from .create_task_screen import CreateTaskScreen
-from .renderers import ReasoningRenderer, StreamingMarkdownRenderer
-from .session_list_screen import SessionListScreen
-from .task_list_screen import TaskListScreen
+from .renderers import (
+    ReasoningRenderer,
+    StreamingMarkdownRenderer,
+    StreamingRendererBase,
+)
+
+if TYPE_CHECKING:
+    from .create_task_screen import CreateTaskScreen
+
+_SYSTEM_STYLE = Style(italic=True, color="cyan")
+_USER_STYLE = Style(bold=True, color="blue")
+_AGENT_STYLE = Style(bold=True, color="green")
+_ERROR_STYLE = Style(bold=True, color="red")
+_TOOL_STYLE = Style(bold=True, color="yellow")
+_TOOL_OUTPUT_STYLE = Style(color="cyan")
+_REASONING_STYLE = Style(dim=True, italic=True, color="magenta")
+# Seconds a probed list of tool-capable models is reused for new tasks.
+_MODELS_CACHE_TTL = 30.0
 
 
 class ChatInterface(App):
@@ -58,12 +76,22 @@ class ChatInterface(App):
         Binding("ctrl+t", "create_task", "Create Task"),
     ]
 
-    def __init__(self, agent: OllamaAgent, builtin_tool_timeout: int = 30):
+    def __init__(
+        self,
+        agent: OllamaAgent,
+        builtin_tool_timeout: int = 30,
+        scrollback: int = 5000,
+    ):
         super().__init__()
         self.agent = agent
+        self.scrollback = max(1, scrollback)
         self.task_manager = TaskManager()
         self._chat_log: RichLog | None = None
         self._input_field: Input | None = None
+        self._pinned = True
+        self._visible = True
+        self._renderers: list[StreamingRendererBase] = []
+        self._models_cache: tuple[str, list[str], float] | None = None
         set_builtin_tool_timeout(builtin_tool_timeout)
 
     @property
@@ -78,6 +106,21 @@ class ChatInterface(App):
             raise RuntimeError("Input widget not ready")
         return self._input_field
 
+    def _on_chat_log_scroll(self, scroll_y: float) -> None:
+        """Follow new output only while the log is scrolled to the bottom."""
+        self._pinned = scroll_y >= self.chat_log.max_scroll_y - 1
+        self.chat_log.auto_scroll = self._pinned
+
+    def _pin_chat_log(self) -> None:
+        """Jump to the end of the log and follow new output again."""
+        self._pinned = True
+        self.chat_log.auto_scroll = True
+        self.chat_log.scroll_end(animate=False)
+
+    def _clear_chat_log(self) -> None:
+        self.chat_log.clear()
+        self._pin_chat_log()
+
     def _blank_line(self) -> None:
         self.chat_log.write("")
 
@@ -89,7 +132,7 @@ class ChatInterface(App):
         self,
         message: str,
         *,
-        style: str,
+        style: Style,
         prefix: Optional[str] = None,
         markdown: bool = False,
     ) -> None:
@@ -107,7 +150,13 @@ class ChatInterface(App):
         yield Header()
 
         with Vertical(id="chat-container"):
-            yield RichLog(id="chat-log", highlight=True, markup=True, wrap=True)
+            yield RichLog(
+                id="chat-log",
+                highlight=True,
+                markup=True,
+                wrap=True,
+                max_lines=self.scrollback,
+            )
 
         with Container(id="input-container"):
             yield Input(
@@ -123,22 +172,36 @@ class ChatInterface(App):
         self.title = "Ollama Agent - Chat"
         self._chat_log = self.query_one("#chat-log", RichLog)
         self._input_field = self.query_one("#user-input", Input)
+        self.watch(self.chat_log, "scroll_y",
+                   self._on_chat_log_scroll, init=False)
 
         self._set_subtitle(session_id)
-        self._write_message("Welcome to Ollama Agent!", style="italic cyan")
+        self._write_message("Welcome to Ollama Agent!", style=_SYSTEM_STYLE)
         self._write_message(
-            f"Session ID: {session_id}", style="italic cyan")
+            f"Session ID: {session_id}", style=_SYSTEM_STYLE)
         self._write_message(
             "Type your message and press Enter to send. Use Ctrl+V to paste text.",
-            style="italic cyan",
+            style=_SYSTEM_STYLE,
         )
         self._write_message(
             "Shortcuts: Ctrl+R=New Session | Ctrl+S=Load Session | Ctrl+T=Create Task | Ctrl+L=Tasks",
-            style="italic cyan",
+            style=_SYSTEM_STYLE,
         )
         self._blank_line()
         self.input_field.focus()
 
+    def on_app_blur(self, event: events.AppBlur) -> None:
+        """Stop redrawing streamed output while the terminal is in the background."""
+        self._visible = False
+        for renderer in self._renderers:
+            renderer.pause()
+
+    def on_app_focus(self, event: events.AppFocus) -> None:
+        """Catch up on output streamed while the terminal was in the background."""
+        self._visible = True
+        for renderer in self._renderers:
+            renderer.resume()
+
     async def on_unmount(self) -> None:
         """Execute when the application is unmounted."""
         # Cleanup MCP servers
@@ -154,36 +217,53 @@ class ChatInterface(App):
         """Render a streamed agent response into the chat log."""
         text_renderer = StreamingMarkdownRenderer(self.chat_log)
         reasoning_renderer = ReasoningRenderer(self.chat_log)
-
-        def handle_text_delta(event: dict) -> None:
+        renderers = (text_renderer, reasoning_renderer)
+        if not self._visible:
+            for renderer in renderers:
+                renderer.pause()
+        self._renderers.extend(renderers)
+
+        def flush_renderers() -> None:
+            for renderer in renderers:
+                renderer.flush()
+
+        # Redraw on a display-rate timer so buffered tokens are shown even
+        # while the stream is idle (e.g. waiting on a tool call).
+        render_timer = self.set_interval(
+            text_renderer.min_interval, flush_renderers)
+
+        # Bound once: the delta handlers run for every streamed token.
+        write = self.chat_log.write
+        append_text = text_renderer.append_token
+        start_reasoning = reasoning_renderer.start_reasoning
+        append_reasoning = reasoning_renderer.append_reasoning_token
+
+        def handle_text_delta(event: StreamEvent) -> None:
             if reasoning_renderer.is_active:
                 reasoning_renderer.finalize_reasoning()
-            text_renderer.append_token(event.get("content", ""))
+            append_text(event.content)
 
-        def handle_reasoning_delta(event: dict) -> None:
-            reasoning_renderer.start_reasoning()
-            reasoning_renderer.append_reasoning_token(event.get("content", ""))
+        def handle_reasoning_delta(event: StreamEvent) -> None:
+            start_reasoning()
+            append_reasoning(event.content)
 
-        def handle_reasoning_summary(event: dict) -> None:
+        def handle_reasoning_summary(event: StreamEvent) -> None:
             if reasoning_renderer.is_active:
                 return
-            preview = event.get("content", "")[:100]
+            preview = event.content[:100]
             if preview:
-                self.chat_log.write(Text(f"💭 Reasoning: {preview}...",
-                                         style="dim italic magenta"))
+                write(Text(f"💭 Reasoning: {preview}...",
+                           style=_REASONING_STYLE))
 
-        def handle_tool_call(event: dict) -> None:
+        def handle_tool_call(event: StreamEvent) -> None:
             if reasoning_renderer.is_active:
                 reasoning_renderer.finalize_reasoning()
-            tool_name = event.get("name", "unknown tool")
-            self.chat_log.write(Text(f"🔧 Calling tool: {tool_name}",
-                                     style="bold yellow"))
+            tool_name = event.name or "unknown tool"
+            write(Text(f"🔧 Calling tool: {tool_name}", style=_TOOL_STYLE))
 
-        def handle_tool_output(event: dict) -> None:
-            output = event.get("output", "")
-            preview = f"{output[:100]}..." if len(output) > 100 else output
-            self.chat_log.write(Text(f"📤 Tool output: {preview}",
-                                     style="cyan"))
+        def handle_tool_output(event: StreamEvent) -> None:
+            preview = event.output_preview
+            write(Text(f"📤 Tool output: {preview}", style=_TOOL_OUTPUT_STYLE))
 
         try:
             event_handlers = {
@@ -201,20 +281,22 @@ class ChatInterface(App):
                 model=model,
                 reasoning_effort=reasoning_effort,
                 on_error=lambda event: self._write_message(
-                    event.get("content", "Unknown error"),
-                    style="bold red",
+                    event.content or "Unknown error",
+                    style=_ERROR_STYLE,
                     prefix="Error",
                 ),
                 ignore={"agent_update"},
             )
         except Exception as exc:
-            self._write_message(str(exc), style="bold red", prefix="Error")
+            self._write_message(str(exc), style=_ERROR_STYLE, prefix="Error")
         finally:
+            render_timer.stop()
             if reasoning_renderer.is_active:
                 reasoning_renderer.finalize_reasoning()
             text_renderer.finalize()
+            for renderer in renderers:
+                self._renderers.remove(renderer)
             self._blank_line()
-            self.chat_log.scroll_end(animate=False)
 
     async def on_input_submitted(self, event: Input.Submitted) -> None:
         """Handle user message submission."""
@@ -225,85 +307,123 @@ class ChatInterface(App):
         # Clear the input
         self.input_field.value = ""
 
-        self._write_message(message, style="bold blue", prefix="User")
+        # A new prompt brings the log back to the bottom, even if the user
+        # scrolled away while reading an earlier reply.
+        self._pin_chat_log()
+        self._write_message(message, style=_USER_STYLE, prefix="User")
         await self._stream_agent_response(message)
 
     def action_reset_session(self) -> None:
         """Reset the session and start a new conversation."""
         session_id = self.agent.reset_session()
-        self.chat_log.clear()
-        self._write_message("New session started!", style="italic cyan")
+        self._clear_chat_log()
+        self._write_message("New session started!", style=_SYSTEM_STYLE)
         self._write_message(
-            f"Session ID: {session_id}", style="italic cyan")
+            f"Session ID: {session_id}", style=_SYSTEM_STYLE)
         self._write_message(
             "Previous conversation history has been cleared.",
-            style="italic cyan",
+            style=_SYSTEM_STYLE,
         )
         self._blank_line()
 
         # Update subtitle with new session ID
         self._set_subtitle(session_id)
 
-    def action_load_session(self) -> None:
+    async def action_load_session(self) -> None:
         """Show the session list dialog."""
+        from .session_list_screen import SessionListScreen, load_session_rows
+
         async def handle_session_action(action: str | None) -> None:
             """Handle the selected action."""
             if action and action.startswith("load:"):
                 session_id = action.replace("load:", "")
                 await self._load_selected_session(session_id)
 
-        self.push_screen(SessionListScreen(self.agent), handle_session_action)
+        rows = await asyncio.to_thread(load_session_rows, self.agent)
+        self.push_screen(
+            SessionListScreen(self.agent, rows), handle_session_action)
 
     async def _load_selected_session(self, session_id: str) -> None:
         """Load the selected session and display its history."""
         self.agent.load_session(session_id)
 
-        log = self.chat_log
-        log.clear()
+        self._clear_chat_log()
         self._write_message(
-            f"Loaded session: {session_id}", style="italic cyan")
+            f"Loaded session: {session_id}", style=_SYSTEM_STYLE)
         self._blank_line()
 
         history = await self.agent.get_session_history(session_id)
 
-        for item in history:
-            if isinstance(item, dict):
-                role = item.get('role', 'unknown')
-                content = item.get('content', '')
-                text = extract_text(content)
-
-                if role == 'user' and text:
-                    self._write_message(text, style="bold blue", prefix="User")
-                elif role == 'assistant' and text:
-                    self._write_message(
-                        text,
-                        style="bold green",
-                        prefix="Agent",
-                        markdown=True,
-                    )
+        # Replay under one repaint and scroll once at the end rather than
+        # once per written message.
+        with self.batch_update():
+            self.chat_log.auto_scroll = False
+            try:
+                for item in history:
+                    if isinstance(item, dict):
+                        role = item.get('role', 'unknown')
+                        content = item.get('content', '')
+                        text = extract_text(content)
+
+                        if role == 'user' and text:
+                            self._write_message(
+                                text, style=_USER_STYLE, prefix="User")
+                        elif role == 'assistant' and text:
+                            self._write_message(
+                                text,
+                                style=_AGENT_STYLE,
+                                prefix="Agent",
+                                markdown=True,
+                            )
 
-        self._blank_line()
-        log.scroll_end(animate=False)
+                self._blank_line()
+            finally:
+                self.chat_log.auto_scroll = self._pinned
+        if self._pinned:
+            self.chat_log.scroll_end(animate=False)
 
         # Update subtitle
         self._set_subtitle(session_id)
 
     def action_create_task(self) -> None:
         """Show the create task dialog."""
-        def handle_task_creation(task: Optional[Task]) -> None:
+        from .create_task_screen import CreateTaskScreen
+
+        async def handle_task_creation(task: Optional[Task]) -> None:
             """Handle the created task."""
             if task:
-                task_id = self.task_manager.save_task(task)
+                task_id = await asyncio.to_thread(self.task_manager.save_task, task)
                 self._write_message(
                     f"Task saved: {task.title} ({task_id})",
-                    style="italic cyan",
+                    style=_SYSTEM_STYLE,
                 )
                 self._blank_line()
 
-        self.push_screen(CreateTaskScreen(self.agent), handle_task_creation)
+        self.push_screen(
+            CreateTaskScreen(self.agent, models=self._cached_models()),
+            handle_task_creation,
+        )
+
+    def on_create_task_screen_models_loaded(
+        self, message: "CreateTaskScreen.ModelsLoaded"
+    ) -> None:
+        """Remember models probed by the create-task dialog."""
+        self._models_cache = (
+            self.agent.model, message.models, time.monotonic())
+
+    def _cached_models(self) -> Optional[list[str]]:
+        """Return recently probed task models for the current agent model."""
+        if self._models_cache is None:
+            return None
+        model, models, stamp = self._models_cache
+        if model != self.agent.model or time.monotonic() - stamp > _MODELS_CACHE_TTL:
+            return None
+        return models
 
     def action_list_tasks(self) -> None:
         """Show the task list dialog."""
+        from .task_list_screen import TaskListScreen
+
         def handle_task_action(action: Optional[str]) -> None:
             """Handle the selected action."""
             if action and action.startswith("run:"):
@@ -314,18 +434,19 @@ class ChatInterface(App):
 
     async def _run_selected_task(self, task_id: str) -> None:
         """Execute the selected task."""
-        task = self.task_manager.load_task(task_id)
+        task = await asyncio.to_thread(self.task_manager.load_task, task_id)
 
         if not task:
             self._write_message(
-                f"Task not found: {task_id}", style="bold red", prefix="Error")
+                f"Task not found: {task_id}", style=_ERROR_STYLE, prefix="Error")
             return
 
+        self._pin_chat_log()
         self._write_message(
             f"Executing task: {task.title} ({task_id})",
-            style="italic cyan",
+            style=_SYSTEM_STYLE,
         )
-        self._write_message(task.prompt, style="bold blue", prefix="User")
+        self._write_message(task.prompt, style=_USER_STYLE, prefix="User")
 
         await self._stream_agent_response(
             task.prompt,
@@ -3,6 +3,7 @@ from typing import Optional
 from textual.app import ComposeResult
 from textual.binding import Binding
 from textual.containers import Container, Horizontal
+from textual.message import Message
 from textual.screen import ModalScreen
 from textual.widgets import Button, Input, Label, Select, Static
 
@@ -16,10 +17,36 @@ from ..utils import (
 )
 
 
+def load_task_models(preferred: Optional[str] = None) -> list[str]:
+    """
+    Return the tool-capable models offered when creating a task.
+
+    Falls back to every tool-capable model when ``preferred`` is unusable.
+
+    Raises:
+        ModelCapabilityError: If no tool-capable model can be listed.
+    """
+    error: Optional[ModelCapabilityError] = None
+    try:
+        models = get_tool_compatible_models(preferred)
+    except ModelCapabilityError as exc:
+        error = exc
+        models = []
+    if not models:
+        try:
+            models = get_tool_compatible_models()
+        except ModelCapabilityError as exc:
+            raise error or exc
+    if not models:
+        raise error or ModelCapabilityError(
+            "No models with tool support are available.")
+    return models
+
+
 class CreateTaskScreen(ModalScreen):
     """Modal screen to create a new task."""
 
-    CSS = """
+    DEFAULT_CSS = """
     CreateTaskScreen {
         align: center middle;
     }
@@ -59,33 +86,26 @@ class CreateTaskScreen(ModalScreen):
         Binding("escape", "dismiss", "Cancel"),
     ]
 
-    def __init__(self, agent: OllamaAgent):
+    class ModelsLoaded(Message):
+        """Posted to the app once tool-capable models have been probed."""
+
+        def __init__(self, models: list[str]):
+            super().__init__()
+            self.models = models
+
+    def __init__(self, agent: OllamaAgent, models: Optional[list[str]] = None):
         """
         Initialize the create task screen.
 
         Args:
             agent: The agent instance for getting current settings.
+            models: Tool-capable models to offer; probed in a worker when omitted.
         """
         super().__init__()
         self.agent = agent
-        self._models: list[str] = []
+        self.models: list[str] = models or []
+        self._loading = models is None
         self._error: Optional[str] = None
-        try:
-            self._models = get_tool_compatible_models(self.agent.model)
-        except ModelCapabilityError as exc:
-            self._error = str(exc)
-        if not self._models:
-            try:
-                fallback_models = get_tool_compatible_models()
-            except ModelCapabilityError as exc:
-                if self._error is None:
-                    self._error = str(exc)
-            else:
-                if fallback_models:
-                    self._models = fallback_models
-                    self._error = None
-        if not self._models and self._error is None:
-            self._error = "No models with tool support are available."
 
     def compose(self) -> ComposeResult:
         """Create the task creation dialog."""
@@ -98,18 +118,18 @@ class CreateTaskScreen(ModalScreen):
             yield Label("Prompt:", classes="field-label")
             yield Input(placeholder="Enter task prompt...", id="task-prompt-input", classes="field-input")
 
-            if self._error:
-                yield Static(self._error, classes="field-label")
-            else:
-                yield Label("Model:", classes="field-label")
-                default_model = self.agent.model if self.agent.model in self._models else self._models[
-                    0]
-                yield Select(
-                    [(model, model) for model in self._models],
-                    value=default_model,
-                    id="task-model-select",
-                    classes="field-input"
-                )
+            yield Label("Model:", classes="field-label")
+            yield Select(
+                [(model, model) for model in self.models],
+                prompt="Loading models…" if self._loading else "Select",
+                value=self._default_model() or Select.NULL,
+                id="task-model-select",
+                classes="field-input",
+                disabled=self._loading,
+            )
+            model_error = Static("", id="task-model-error", classes="field-label")
+            model_error.display = False
+            yield model_error
 
             yield Label("Reasoning Effort:", classes="field-label")
             yield Select(
@@ -120,9 +140,50 @@ class CreateTaskScreen(ModalScreen):
             )
 
             with Horizontal(id="button-container"):
-                yield Button("Save", variant="primary", id="save-button", disabled=bool(self._error))
+                yield Button("Save", variant="primary", id="save-button", disabled=self._loading)
                 yield Button("Cancel", variant="default", id="cancel-button")
 
+    def on_mount(self) -> None:
+        """Probe models off the UI thread when none were provided."""
+        if self._loading:
+            self.run_worker(self._load_models, thread=True, exclusive=True)
+
+    def _default_model(self) -> Optional[str]:
+        if self.agent.model in self.models:
+            return self.agent.model
+        return self.models[0] if self.models else None
+
+    def _load_models(self) -> None:
+        """Worker: list tool-capable models and hand them to the UI thread."""
+        try:
+            models = load_task_models(self.agent.model)
+        except ModelCapabilityError as exc:
+            self.app.call_from_thread(self._show_models, [], str(exc))
+        else:
+            self.app.call_from_thread(self._show_models, models, None)
+
+    def _show_models(self, models: list[str], error: Optional[str]) -> None:
+        if models:
+            self.app.post_message(self.ModelsLoaded(models))
+        if not self.is_attached:
+            return
+
+        self.models = models
+        self._loading = False
+        self._error = error
+        model_select = self.query_one("#task-model-select", Select)
+        if error:
+            model_select.display = False
+            model_error = self.query_one("#task-model-error", Static)
+            model_error.update(error)
+            model_error.display = True
+            return
+
+        model_select.set_options([(model, model) for model in models])
+        model_select.value = self._default_model() or Select.NULL
+        model_select.disabled = False
+        self.query_one("#save-button", Button).disabled = False
+
     def on_button_pressed(self, event: Button.Pressed) -> None:
         """Handle button press."""
         if event.button.id == "cancel-button":
@@ -139,7 +200,7 @@ class CreateTaskScreen(ModalScreen):
         Returns:
             Task instance if all inputs are valid, None otherwise.
         """
-        if self._error:
+        if self._error or self._loading:
             return None
 
         title = self.query_one("#task-title-input", Input).value.strip()
@@ -2,20 +2,26 @@
 
 from __future__ import annotations
 
-from typing import Iterable, Sequence
+from itertools import chain
+from typing import Any, Callable, ClassVar, Iterable
 
 from textual.app import ComposeResult
 from textual.binding import Binding
-from textual.containers import Container, VerticalScroll
+from textual.containers import Container, Horizontal
 from textual.screen import ModalScreen
-from textual.widget import Widget
-from textual.widgets import Button, Label
+from textual.widgets import Button, Label, OptionList
+from textual.widgets.button import ButtonVariant
+from textual.widgets.option_list import Option
 
 
 class ListModalScreen(ModalScreen):
-    """Modal screen that renders a list of items with a close button."""
+    """Modal screen that lists entries in one OptionList with action buttons.
 
-    CSS = """
+    The buttons act on the highlighted entry; selecting an entry (enter or
+    click) runs the first action.
+    """
+
+    DEFAULT_CSS = """
     ListModalScreen {
         align: center middle;
     }
@@ -40,7 +46,6 @@ class ListModalScreen(ModalScreen):
         height: 18;
         border: solid $primary;
         margin: 1 0;
-        overflow-x: hidden;
     }
 
     #button-container {
@@ -48,42 +53,84 @@ class ListModalScreen(ModalScreen):
         align: center middle;
     }
 
-    .entry-row {
-        width: 100%;
-        margin-bottom: 1;
-    }
-
-    .entry-info {
-        width: 3fr;
-    }
-
     .entry-btn {
-        width: 1fr;
         min-width: 10;
-        margin-left: 1;
+        margin-right: 1;
     }
     """
 
-    BINDINGS = [Binding("escape", "dismiss", "Cancel")]
+    BINDINGS = [
+        Binding("escape", "dismiss", "Cancel"),
+        Binding("delete", "entry('delete')", "Delete", show=False),
+    ]
+
+    # (label, variant, action) for each button acting on the highlighted entry.
+    ROW_BUTTONS: ClassVar[tuple[tuple[str, ButtonVariant, str], ...]] = ()
+    # Action name -> handler(screen, entry id).
+    ROW_ACTIONS: ClassVar[dict[str, Callable[[Any, str], None]]] = {}
 
     def __init__(self, title: str, empty_message: str) -> None:
         super().__init__()
         self._title = title
         self._empty_message = empty_message
+        self._emptied = False
 
     def compose(self) -> ComposeResult:
-        items = list(self.load_items())
+        # Once the last entry is deleted there is nothing left to reload.
+        items = iter(() if self._emptied else self.load_items())
+        first = next(items, None)
         with Container(id="modal-dialog"):
             yield Label(self._title, id="modal-title")
-            if items:
-                with VerticalScroll(id="items-list"):
-                    yield from self.render_rows(items)
+            if first is not None:
+                rows = self.render_rows(chain((first,), items))
+                # ``None`` adds a divider under each entry; it goes with the
+                # entry when that is removed.
+                yield OptionList(
+                    *chain.from_iterable((row, None) for row in rows),
+                    id="items-list",
+                )
             else:
                 yield Label(self._empty_message, id="modal-empty")
-            with Container(id="button-container"):
+            with Horizontal(id="button-container"):
+                if first is not None:
+                    for label, variant, action in self.ROW_BUTTONS:
+                        yield Button(label, variant=variant, name=action,
+                                     classes="entry-btn")
                 yield Button("Close", variant="default", id="cancel-button")
 
-    def render_rows(self, items: Sequence[object]) -> Iterable[Widget]:  # pragma: no cover - abstract
+    def on_button_pressed(self, event: Button.Pressed) -> None:
+        if event.button.id == "cancel-button":
+            self.dismiss(None)
+        elif event.button.name:
+            self.action_entry(event.button.name)
+
+    def on_option_list_option_selected(self, event: OptionList.OptionSelected) -> None:
+        if self.ROW_BUTTONS and event.option.id:
+            self._run_action(self.ROW_BUTTONS[0][2], event.option.id)
+
+    def action_entry(self, action: str) -> None:
+        """Run ``action`` on the highlighted entry, if any."""
+        options = self.query(OptionList)
+        option = options.first().highlighted_option if options else None
+        if option is not None and option.id:
+            self._run_action(action, option.id)
+
+    def _run_action(self, action: str, entry_id: str) -> None:
+        handler = self.ROW_ACTIONS.get(action)
+        if handler is not None:
+            handler(self, entry_id)
+
+    def remove_row(self, entry_id: str) -> None:
+        """Drop one entry; recompose only to show the empty state."""
+        option_list = self.query_one(OptionList)
+        if option_list.option_count > 1:
+            option_list.remove_option(entry_id)
+            option_list.focus()
+        else:
+            self._emptied = True
+            self.refresh(recompose=True)
+
+    def render_rows(self, items: Iterable[object]) -> Iterable[Option]:  # pragma: no cover - abstract
         raise NotImplementedError
 
     def load_items(self) -> Iterable[object]:  # pragma: no cover - abstract
@@ -1,114 +1,335 @@
 """TUI renderers for streaming markdown and reasoning."""
 
+import re
+import time
+from typing import Any, Optional
+
 from rich.markdown import Markdown as RichMarkdown
+from rich.style import Style
 from rich.text import Text
 from textual.widgets import RichLog
 
+_FENCE_RE = re.compile(r" {0,3}(`{3,}|~{3,})(.*)")
+_LIST_ITEM_RE = re.compile(r" {0,3}(?:[-+*]|\d{1,9}[.)])(?:\s|$)")
+# Reference link definitions (``[id]: url``) and full or collapsed
+# reference links (``[text][id]``, ``[text][]``); they only resolve when
+# parsed together with the rest of the document.
+_LINK_DEF_RE = re.compile(r" {0,3}\[[^\]]+\]:")
+_REF_LINK_RE = re.compile(r"\]\[[^\]]*\]")
+_AGENT_STYLE = Style(bold=True, color="green")
+_THINKING_LABEL = "🧠 Thinking: "
+_THINKING_LABEL_STYLE = Style(bold=True, color="magenta")
+_THINKING_STYLE = Style(dim=True, italic=True, color="magenta")
+# Blocks that Rich already opens with a blank line of their own.
+_SELF_SPACED_BLOCKS = frozenset(
+    {"bullet_list_open", "ordered_list_open", "blockquote_open", "table_open"}
+)
 
-def _clear_log_lines(log: RichLog, start_line: int) -> None:
-    """Remove rendered lines after ``start_line`` and clear RichLog caches."""
 
-    while len(log.lines) > start_line:
-        log.lines.pop()
+def _log_position(log: RichLog) -> int:
+    """Return the absolute index of the next line written to ``log``.
 
-    # RichLog lacks a public API to drop cached rendered lines; clear manually.
-    if hasattr(log, "_line_cache"):
-        log._line_cache.clear()
+    RichLog drops its oldest lines once ``max_lines`` is exceeded and counts
+    them in ``_start_line``; absolute positions stay valid across that trim.
+    """
 
+    return log._start_line + len(log.lines)
 
-class StreamingMarkdownRenderer:
-    """Render markdown content progressively inside a RichLog widget."""
 
-    def __init__(self, chat_log: RichLog, update_frequency: int = 5):
+def _clear_log_lines(log: RichLog, start_line: int, cache: Any) -> None:
+    """Remove rendered lines after absolute ``start_line`` and their caches.
+
+    ``cache`` is the log's rendered-line cache, or ``None`` if it has none.
+    """
+
+    del log.lines[max(0, start_line - log._start_line):]
+
+    # RichLog lacks a public API to drop cached rendered lines. Its cache keys
+    # start with the absolute line index, so only drop the rewritten lines
+    # and fall back to a full clear if that layout ever changes.
+    if cache is None:
+        return
+    try:
+        stale = [key for key in cache.keys() if key[0] >= start_line]
+        for key in stale:
+            cache.discard(key)
+    except (AttributeError, IndexError, TypeError):
+        cache.clear()
+
+
+def _refresh_log_lines(log: RichLog, start_line: int, end_line: int) -> None:
+    """Repaint absolute lines ``start_line`` up to ``end_line`` of ``log``.
+
+    Rewriting lines in place can leave the log's virtual size unchanged, in
+    which case ``write`` schedules no repaint of its own.
+    """
+
+    first = max(0, start_line - log._start_line)
+    log.refresh_lines(first, max(1, end_line - log._start_line - first))
+
+
+def _last_block_boundary(text: str, start: int) -> int:
+    """Return the end of the last complete markdown block in ``text[start:]``.
+
+    A boundary is a blank line outside fenced code followed by a complete
+    line that opens a new top-level block (indented lines and further items
+    of a list continue it). ``start`` means no boundary yet. Nothing from
+    the first block that uses reference links onward is committed, since
+    those must be parsed together with their definitions.
+    """
+
+    boundary = start
+    fence: tuple[str, int] | None = None  # (character, length) of the open fence
+    in_block = False
+    in_list = False
+    after_blank = False
+    pos = start
+    while True:
+        line_end = text.find("\n", pos)
+        if line_end == -1:
+            return boundary
+        line = text[pos:line_end]
+        if not line.strip():
+            after_blank = in_block and fence is None
+        else:
+            is_item = _LIST_ITEM_RE.match(line) is not None
+            if after_blank and not line[0].isspace() and not (in_list and is_item):
+                boundary = pos
+                in_list = is_item
+            else:
+                in_list = in_list or is_item
+            match = _FENCE_RE.match(line)
+            if fence is None:
+                if match and not (match[1][0] == "`" and "`" in match[2]):
+                    fence = (match[1][0], len(match[1]))
+                elif _LINK_DEF_RE.match(line) or _REF_LINK_RE.search(line):
+                    return boundary
+            elif (
+                match
+                and match[1][0] == fence[0]
+                and len(match[1]) >= fence[1]
+                and not match[2].strip()
+            ):
+                fence = None
+            in_block = True
+            after_blank = False
+        pos = line_end + 1
+
+
+class StreamingRendererBase:
+    """Shared redraw throttle for renderers fed one token at a time.
+
+    Tokens are buffered as they arrive and redrawn at most once per
+    ``min_interval`` seconds (one display frame by default), so render work
+    follows the terminal refresh rate instead of the model's token rate.
+    """
+
+    def __init__(self, chat_log: RichLog, min_interval: float = 1 / 60):
         self.chat_log = chat_log
-        self.update_frequency = max(1, update_frequency)
-        self.buffer = ""
+        self.min_interval = min_interval
+        self._min_interval_ns = int(min_interval * 1_000_000_000)
+        # Resolved once: RichLog keeps the same cache object for its lifetime.
+        self._line_cache = getattr(chat_log, "_line_cache", None)
         self.token_count = 0
+        self.paused = False
+        self._rendered_tokens = 0
+        self._chunks: list[str] = []
+        self._buffer_len = 0
+        self._rendered_len = 0
+        self._last_render_ns = 0
         self._start_line_count = 0
+
+    def pause(self) -> None:
+        """Keep buffering tokens without redrawing them."""
+        self.paused = True
+
+    def resume(self) -> None:
+        """Redraw whatever was buffered while paused."""
+        self.paused = False
+        if self.token_count > self._rendered_tokens:
+            self._flush()
+
+    def _reset_cadence(self) -> None:
+        self.token_count = 0
+        self._rendered_tokens = 0
+        self._buffer_len = 0
+        self._rendered_len = 0
+
+    def _append(self, token: str) -> None:
+        self._chunks.append(token)
+        self._buffer_len += len(token)
+        self.token_count += 1
+        self.flush_if_due()
+
+    def _joined(self) -> str:
+        """Return the buffered text, collapsing the chunks into one string.
+
+        Reads with no appends in between reuse that string instead of joining
+        again, and the chunk list never grows past one redraw's tokens.
+        """
+        chunks = self._chunks
+        if len(chunks) > 1:
+            chunks[:] = ["".join(chunks)]
+        return chunks[0] if chunks else ""
+
+    def flush(self) -> None:
+        """Render buffered tokens now unless paused or already up to date."""
+        if self.paused or self.token_count == self._rendered_tokens:
+            return
+        self._flush()
+
+    def flush_if_due(self) -> None:
+        """Render buffered tokens if a frame has passed since the last redraw."""
+        if time.monotonic_ns() - self._last_render_ns >= self._min_interval_ns:
+            self.flush()
+
+    def _flush(self) -> None:
+        self._rendered_tokens = self.token_count
+        self._last_render_ns = time.monotonic_ns()
+        # Empty tokens leave the output as it was; skip the redraw.
+        if self._buffer_len == self._rendered_len:
+            return
+        self._rendered_len = self._buffer_len
+        self._update_display()
+
+    def _update_display(self) -> None:  # pragma: no cover - abstract
+        raise NotImplementedError
+
+
+class StreamingMarkdownRenderer(StreamingRendererBase):
+    """Render markdown content progressively inside a RichLog widget."""
+
+    def __init__(self, chat_log: RichLog, min_interval: float = 1 / 60):
+        super().__init__(chat_log, min_interval)
         self._rendering_started = False
+        # Committed blocks leave ``_chunks``, which only holds the open tail.
+        self._committed: list[str] = []
+        self._tail_start_line = 0
+        self._needs_separator = False
 
     def start_rendering(self) -> None:
         """Prepare the log for streaming output (only once)."""
         if not self._rendering_started:
-            self.chat_log.write(Text("Agent:", style="bold green"))
-            self._start_line_count = len(self.chat_log.lines)
+            self.chat_log.write(Text("Agent:", style=_AGENT_STYLE))
+            self._start_line_count = _log_position(self.chat_log)
+            self._tail_start_line = self._start_line_count
             self._rendering_started = True
 
+    @property
+    def buffer(self) -> str:
+        """Markdown text accumulated so far."""
+        return "".join(self._committed) + self._joined()
+
     def append_token(self, token: str) -> None:
-        """Append a token and refresh the view at the configured cadence."""
+        """Append a token and refresh the view at most once per frame."""
         if not self._rendering_started:
             self.start_rendering()
 
-        self.buffer += token
-        self.token_count += 1
-        if self.token_count % self.update_frequency == 0:
-            self._update_display()
+        self._append(token)
 
     def finalize(self) -> None:
         """Render the buffered markdown one last time."""
-        self._update_display()
+        self._flush()
 
     def _update_display(self) -> None:
-        if not self.buffer:
-            return
+        """Commit finished markdown blocks and redraw the open tail.
+
+        Blocks that end before the last safe boundary are written once, moved
+        out of the buffered chunks and never re-parsed; only the trailing,
+        still-growing block is joined and redrawn.
+        """
+        tail = self._joined()
+        redraw_start = self._tail_start_line
+        old_end = _log_position(self.chat_log)
+        _clear_log_lines(self.chat_log, redraw_start, self._line_cache)
+
+        split = _last_block_boundary(tail, 0)
+        if split:
+            block = tail[:split]
+            needs_separator = self._write_markdown(block)
+            if needs_separator is not None:
+                self._needs_separator = needs_separator
+            self._committed.append(block)
+            tail = tail[split:]
+            self._chunks[:] = [tail]
+            self._tail_start_line = _log_position(self.chat_log)
 
-        _clear_log_lines(self.chat_log, self._start_line_count)
-        self.chat_log.write(RichMarkdown(self.buffer))
-        self.chat_log.scroll_end(animate=False)
-        self.chat_log.refresh()
+        if tail.strip():
+            self._write_markdown(tail)
+        _refresh_log_lines(
+            self.chat_log, redraw_start,
+            max(old_end, _log_position(self.chat_log)))
 
+    def _write_markdown(self, text: str) -> Optional[bool]:
+        """Write ``text`` spaced as if it were part of one markdown document.
 
-class ReasoningRenderer:
+        Returns whether a block written after it needs a separator line, or
+        ``None`` if ``text`` holds no blocks.
+        """
+        markdown = RichMarkdown(text)
+        tokens = markdown.parsed
+        if not tokens:
+            return None
+        if all(token.type == "html_block" for token in tokens):
+            # Rich renders raw HTML as nothing but the gap before it, while
+            # RichLog would turn the empty render into a line of its own.
+            if self._needs_separator:
+                self.chat_log.write("")
+            return True
+        if self._needs_separator and tokens[0].type not in _SELF_SPACED_BLOCKS:
+            self.chat_log.write("")
+        self.chat_log.write(markdown)
+        return tokens[-1].type != "hr"
+
+
+class ReasoningRenderer(StreamingRendererBase):
     """Render reasoning/thinking process in real-time."""
 
-    def __init__(self, chat_log: RichLog):
-        self.chat_log = chat_log
-        self.reasoning_buffer = ""
+    def __init__(self, chat_log: RichLog, min_interval: float = 1 / 60):
+        super().__init__(chat_log, min_interval)
         self.is_active = False
-        self._start_line_count = 0
-        self._update_counter = 0
-        self._update_frequency = 5  # Update every N tokens for performance
+
+    @property
+    def reasoning_buffer(self) -> str:
+        """Reasoning text accumulated so far."""
+        return self._joined()
 
     def start_reasoning(self) -> None:
         """Start capturing reasoning tokens."""
         if not self.is_active:
             self.chat_log.write("")  # Blank line before reasoning
             self.is_active = True
-            self.reasoning_buffer = ""
-            self._start_line_count = len(self.chat_log.lines)
-            self._update_counter = 0
+            self._chunks.clear()
+            self._start_line_count = _log_position(self.chat_log)
+            self._reset_cadence()
 
     def append_reasoning_token(self, token: str) -> None:
         """Append a reasoning token and update display in real-time."""
-        self.reasoning_buffer += token
-        self._update_counter += 1
-
-        # Update display every N tokens for performance
-        if self._update_counter % self._update_frequency == 0:
-            self._update_display()
+        self._append(token)
 
     def finalize_reasoning(self) -> None:
         """Finish the reasoning display with final update."""
-        if self.is_active and self.reasoning_buffer:
+        if self.is_active and self._buffer_len:
             # Final update to ensure all tokens are shown
-            self._update_display()
+            self._flush()
             self.chat_log.write("")  # Add a blank line after reasoning
         self.is_active = False
-        self.reasoning_buffer = ""
+        self._chunks.clear()
         self._start_line_count = 0
+        self._reset_cadence()
 
     def _update_display(self) -> None:
         """Update the reasoning line in the chat log."""
         # Remove any lines we added before (if updating)
-        _clear_log_lines(self.chat_log, self._start_line_count)
+        old_end = _log_position(self.chat_log)
+        _clear_log_lines(
+            self.chat_log, self._start_line_count, self._line_cache)
 
         # Write the updated reasoning line
-        reasoning_line = Text()
-        reasoning_line.append("🧠 Thinking: ", style="bold magenta")
-        reasoning_line.append(self.reasoning_buffer,
-                              style="dim italic magenta")
-        self.chat_log.write(reasoning_line)
-
-        # Scroll to end to show the update
-        self.chat_log.scroll_end(animate=False)
-        self.chat_log.refresh()
+        self.chat_log.write(Text.assemble(
+            (_THINKING_LABEL, _THINKING_LABEL_STYLE),
+            (self.reasoning_buffer, _THINKING_STYLE),
+        ))
+        _refresh_log_lines(
+            self.chat_log, self._start_line_count,
+            max(old_end, _log_position(self.chat_log)))
@@ -1,58 +1,87 @@
 from datetime import datetime
-from typing import Iterable, Sequence, cast
+from functools import lru_cache
+from typing import Iterable, Optional, cast
 
-from textual.containers import Horizontal
-from textual.widgets import Button, Label
+from rich.style import Style
+from rich.text import Text
+from textual.widgets.option_list import Option
 
 from ..agent import OllamaAgent
 from .list_modal import ListModalScreen
 
+_ID_STYLE = Style(bold=True)
+
+
+def load_session_rows(agent: OllamaAgent) -> list[tuple[str, Text]]:
+    """List the agent's sessions as ``(session_id, row text)`` pairs.
+
+    Does all the storage access and formatting, so it can run in a thread.
+    """
+    rows: list[tuple[str, Text]] = []
+    for data in agent.list_sessions():
+        session_id = str(data.get("session_id", ""))
+        raw_count = data.get("message_count", 0)
+        try:
+            count = int(raw_count)
+        except (TypeError, ValueError):
+            count = 0
+        preview = str(data.get("preview", ""))
+        timestamp = _format_timestamp(str(data.get("last_message", "Unknown")))
+        text = Text.assemble(
+            (f"{session_id[:8]}...", _ID_STYLE),
+            f" ({count} msgs)\n{timestamp}\n{preview[:40]}...",
+        )
+        rows.append((session_id, text))
+    return rows
+
+
+@lru_cache(maxsize=256)
+def _format_timestamp(value: str) -> str:
+    if value == "Unknown":
+        return value
+    # SQLite timestamps are already "YYYY-MM-DD HH:MM:SS[...]"; just slice.
+    if (
+        len(value) >= 19
+        and value[4] == value[7] == "-"
+        and value[10] in "T "
+        and value[13] == value[16] == ":"
+    ):
+        return f"{value[:10]} {value[11:19]}"
+    try:
+        return datetime.fromisoformat(value).strftime("%Y-%m-%d %H:%M:%S")
+    except ValueError:
+        return value
+
 
 class SessionListScreen(ListModalScreen):
     """Modal screen to list and select sessions."""
 
-    def __init__(self, agent: OllamaAgent):
+    def __init__(
+        self,
+        agent: OllamaAgent,
+        rows: Optional[list[tuple[str, Text]]] = None,
+    ):
         super().__init__("Select a Session to Load or Delete", "No sessions found")
         self.agent = agent
+        self._rows = rows
 
     def load_items(self) -> Iterable[object]:
-        return self.agent.list_sessions()
-
-    def render_rows(self, items: Sequence[object]):
-        for session in items:
-            data = cast(dict[str, object], session)
-            session_id = str(data.get("session_id", ""))
-            raw_count = data.get("message_count", 0)
-            try:
-                count = int(raw_count)  # type: ignore[arg-type]
-            except (TypeError, ValueError):
-                count = 0
-            preview = str(data.get("preview", ""))
-            timestamp = self._format_timestamp(str(data.get("last_message", "Unknown")))
-            text = f"[bold]{session_id[:8]}...[/bold] ({count} msgs)\n{timestamp}\n{preview[:40]}..."
-            yield Horizontal(
-                Label(text, classes="entry-info"),
-                Button("Load", variant="primary", id=f"load-{session_id}", classes="entry-btn"),
-                Button("Delete", variant="error", id=f"delete-{session_id}", classes="entry-btn"),
-                classes="entry-row",
-            )
-
-    def on_button_pressed(self, event: Button.Pressed) -> None:
-        button_id = event.button.id or ""
-        if button_id == "cancel-button":
-            self.dismiss(None)
-        elif button_id.startswith("load-"):
-            self.dismiss(f"load:{button_id.removeprefix('load-')}")
-        elif button_id.startswith("delete-"):
-            session_id = button_id.removeprefix("delete-")
-            if self.agent.delete_session(session_id):
-                self.refresh(recompose=True)
-
-    @staticmethod
-    def _format_timestamp(value: str) -> str:
-        if value == "Unknown":
-            return value
-        try:
-            return datetime.fromisoformat(value).strftime("%Y-%m-%d %H:%M:%S")
-        except ValueError:
-            return value
+        if self._rows is None:
+            return load_session_rows(self.agent)
+        rows, self._rows = self._rows, None
+        return rows
+
+    def render_rows(self, items: Iterable[object]):
+        for item in items:
+            session_id, text = cast(tuple[str, Text], item)
+            yield Option(text, id=session_id)
+
+    def _load(self, session_id: str) -> None:
+        self.dismiss(f"load:{session_id}")
+
+    def _delete(self, session_id: str) -> None:
+        if self.agent.delete_session(session_id):
+            self.remove_row(session_id)
+
+    ROW_BUTTONS = (("Load", "primary", "load"), ("Delete", "error", "delete"))
+    ROW_ACTIONS = {"load": _load, "delete": _delete}
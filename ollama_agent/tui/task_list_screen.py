@@ -1,11 +1,14 @@
-from typing import Iterable, Sequence, cast
+from typing import Iterable, cast
 
-from textual.containers import Horizontal
-from textual.widgets import Button, Label
+from rich.style import Style
+from rich.text import Text
+from textual.widgets.option_list import Option
 
 from ..tasks import Task, TaskManager
 from .list_modal import ListModalScreen
 
+_TITLE_STYLE = Style(bold=True)
+
 
 class TaskListScreen(ListModalScreen):
     """Modal screen to list, execute, and delete tasks."""
@@ -17,28 +20,23 @@ class TaskListScreen(ListModalScreen):
     def load_items(self) -> Iterable[object]:
         return self.task_manager.list_tasks()
 
-    def render_rows(self, items: Sequence[object]):
+    def render_rows(self, items: Iterable[object]):
         for item in items:
             task_id, task = cast(tuple[str, Task], item)
-            text = (
-                f"[bold]{task.title}[/bold] ({task_id})\n"
+            text = Text.assemble(
+                (task.title, _TITLE_STYLE),
+                f" ({task_id})\n"
                 f"Model: {task.model} | Effort: {task.reasoning_effort}\n"
-                f"{task.prompt[:50]}..."
-            )
-            yield Horizontal(
-                Label(text, classes="entry-info"),
-                Button("Run", variant="primary", id=f"run-{task_id}", classes="entry-btn"),
-                Button("Delete", variant="error", id=f"delete-{task_id}", classes="entry-btn"),
-                classes="entry-row",
+                f"{task.prompt[:50]}...",
             )
+            yield Option(text, id=task_id)
+
+    def _run(self, task_id: str) -> None:
+        self.dismiss(f"run:{task_id}")
+
+    def _delete(self, task_id: str) -> None:
+        if self.task_manager.delete_task(task_id):
+            self.remove_row(task_id)
 
-    def on_button_pressed(self, event: Button.Pressed) -> None:
-        button_id = event.button.id or ""
-        if button_id == "cancel-button":
-            self.dismiss(None)
-        elif button_id.startswith("run-"):
-            self.dismiss(f"run:{button_id.removeprefix('run-')}")
-        elif button_id.startswith("delete-"):
-            task_id = button_id.removeprefix("delete-")
-            if self.task_manager.delete_task(task_id):
-                self.refresh(recompose=True)
+    ROW_BUTTONS = (("Run", "primary", "run"), ("Delete", "error", "delete"))
+    ROW_ACTIONS = {"run": _run, "delete": _delete}
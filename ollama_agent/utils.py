@@ -1,16 +1,45 @@
 """Utility helpers shared across the application."""
 
+import asyncio
+import json
 import logging
-from functools import lru_cache
-from typing import Any, Iterable, Literal, cast
-
-import ollama
+import os
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from operator import attrgetter
+from pathlib import Path
+from typing import Any, Iterable, Iterator, Literal, Optional
 
 # Type definitions
 ReasoningEffortValue = Literal["low", "medium", "high", "disabled"]
 ALLOWED_REASONING_EFFORTS: tuple[ReasoningEffortValue, ...] = (
     "low", "medium", "high", "disabled")
 DEFAULT_REASONING_EFFORT: ReasoningEffortValue = "medium"
+# Maps accepted spellings to the canonical ``ReasoningEffortValue``.
+_EFFORT_MAP: dict[str, ReasoningEffortValue] = {
+    effort: effort for effort in ALLOWED_REASONING_EFFORTS}
+
+# Seconds a model listing from the Ollama server is reused before refetching.
+_LIST_TTL = 30.0
+_LIST_CACHE: tuple[float, list[Any]] | None = None
+# Concurrent ``ollama.show()`` requests when probing model capabilities.
+_PROBE_WORKERS = 8
+# Model capabilities persisted across runs, refetched when a model's digest changes.
+_CAPS_CACHE_PATH = Path.home() / ".ollama-agent" / "model_capabilities.json"
+# Seconds a failed ``ollama.show()`` is reported again without a new request.
+_FAILED_PROBE_TTL = 5.0
+# Set to "1" to warm the capability caches in the background at import.
+_PREFETCH_ENV = "OLLAMA_AGENT_PREFETCH"
+_PREFETCH_WORKERS = 4
+
+# Marks the end of a nested list while ``extract_text`` walks its stack.
+_LIST_END = object()
+# Name of an entry in an ``ollama.list()`` response.
+_model_name = attrgetter("model")
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -20,22 +49,161 @@ class ModelCapabilityError(RuntimeError):
     """Raised when the selected model cannot run tool calls."""
 
 
-@lru_cache(maxsize=None)
-def _capabilities_for_model(model: str) -> set[str]:
-    try:
-        response = ollama.show(model)
-    except Exception as exc:  # noqa: BLE001
-        raise ModelCapabilityError(
-            f"Failed to fetch metadata for model '{model}': {exc}"
-        ) from exc
+class _CapCache:
+    """Model capabilities held in memory and persisted to a JSON file.
+
+    The file maps model names to ``[digest, capabilities]``; an entry only
+    counts while the server still lists the model with that digest, so a
+    re-pulled model is probed again. The file is replaced atomically, so
+    concurrent processes never read a partial write; at worst one of them
+    probes a model again. Entries stored inside ``batch()`` are written once
+    when the outermost batch ends.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._entries: Optional[dict[str, tuple[str, set[str]]]] = None
+        self._pending: dict[str, tuple[str, set[str]]] = {}
+        self._batch_depth = 0
+        self._lock = threading.Lock()
+
+    def _read(self) -> dict[str, Any]:
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as exc:
+            logger.debug("Ignoring capability cache %s: %s", self.path, exc)
+            return {}
+        return data if isinstance(data, dict) else {}
+
+    def load(self) -> dict[str, tuple[str, set[str]]]:
+        """Return the cached entries, reading the file on first use."""
+        with self._lock:
+            if self._entries is None:
+                entries: dict[str, tuple[str, set[str]]] = {}
+                for model, entry in self._read().items():
+                    try:
+                        digest, stored = entry
+                        entries[model] = (
+                            str(digest), {sys.intern(str(item)) for item in stored})
+                    except (TypeError, ValueError):
+                        continue
+                self._entries = entries
+            return self._entries
+
+    def get(self, model: str, digest: Optional[str]) -> Optional[set[str]]:
+        if digest is None:
+            return None
+        entries = self._entries
+        if entries is None:
+            entries = self.load()
+        entry = entries.get(model)
+        if entry is not None and entry[0] == digest:
+            return entry[1]
+        return None
+
+    def put(self, model: str, digest: Optional[str], capabilities: set[str]) -> None:
+        if digest is None:
+            return
+        entries = self.load()
+        with self._lock:
+            entries[model] = self._pending[model] = (digest, capabilities)
+            if self._batch_depth:
+                return
+        self.flush()
+
+    def begin_batch(self) -> None:
+        """Defer writing stored entries until the matching ``end_batch``."""
+        with self._lock:
+            self._batch_depth += 1
+
+    def end_batch(self) -> None:
+        """Close a batch, writing pending entries if it was the outermost."""
+        with self._lock:
+            self._batch_depth -= 1
+            done = not self._batch_depth
+        if done:
+            self.flush()
+
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        self.begin_batch()
+        try:
+            yield
+        finally:
+            self.end_batch()
+
+    def flush(self) -> None:
+        """Write pending entries, merged with those other processes saved."""
+        with self._lock:
+            if not self._pending:
+                return
+            data = self._read()
+            for model, (digest, capabilities) in self._pending.items():
+                data[model] = [digest, sorted(capabilities)]
+            self._pending.clear()
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                fd, tmp_name = tempfile.mkstemp(
+                    dir=self.path.parent, prefix=".caps-", suffix=".tmp")
+                try:
+                    with os.fdopen(fd, "w", encoding="utf-8") as handle:
+                        json.dump(data, handle)
+                    os.replace(tmp_name, self.path)
+                except BaseException:
+                    os.unlink(tmp_name)
+                    raise
+            except OSError as exc:
+                logger.debug("Could not write capability cache %s: %s",
+                             self.path, exc)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries = {}
+            self._pending.clear()
+            try:
+                self.path.unlink(missing_ok=True)
+            except OSError as exc:
+                logger.debug("Could not remove capability cache %s: %s",
+                             self.path, exc)
 
+
+_CAPS_CACHE = _CapCache(_CAPS_CACHE_PATH)
+# Answers from ``model_supports_tools`` by (model, digest).
+_TOOLS_SUPPORT_CACHE: dict[tuple[str, str], bool] = {}
+# Last answer seen for each model name in this process, for callers that
+# have no digest at hand; refreshed whenever a listing probes the model.
+_TOOLS_SUPPORT_BY_NAME: dict[str, bool] = {}
+# Model -> (monotonic time, error message) of its last failed metadata fetch.
+_FAILED_PROBES: dict[str, tuple[float, str]] = {}
+
+
+def _metadata_error(model: str, exc: Exception) -> ModelCapabilityError:
+    """Build the error for a failed metadata fetch and remember the failure."""
+    message = f"Failed to fetch metadata for model '{model}': {exc}"
+    _FAILED_PROBES[model] = (time.monotonic(), message)
+    return ModelCapabilityError(message)
+
+
+def _recent_failure(model: str) -> Optional[ModelCapabilityError]:
+    """Return the error of a metadata fetch that failed moments ago, if any."""
+    entry = _FAILED_PROBES.get(model)
+    if entry is not None and time.monotonic() - entry[0] < _FAILED_PROBE_TTL:
+        return ModelCapabilityError(entry[1])
+    return None
+
+
+def _store_capabilities(model: str, digest: Optional[str], response: Any) -> set[str]:
+    """Parse an ``ollama.show()`` response and cache the model's capabilities."""
     payload: Any = getattr(response, "capabilities", None)
     if isinstance(payload, dict):
         payload = payload.get("capabilities")
+    # Interned: every model repeats the same few names ("tools", "vision", ...).
     if isinstance(payload, str):
-        capabilities = {payload.lower()}
+        capabilities = {sys.intern(payload.lower())}
     elif isinstance(payload, Iterable):
-        capabilities = {str(item).lower() for item in payload}
+        capabilities = {sys.intern(str(item).lower()) for item in payload}
     else:
         capabilities = set()
     if not capabilities:
@@ -43,41 +211,140 @@ def _capabilities_for_model(model: str) -> set[str]:
             "Model '%s' does not expose capabilities in the Ollama response",
             model,
         )
+    _FAILED_PROBES.pop(model, None)
+    _CAPS_CACHE.put(model, digest, capabilities)
     return capabilities
 
 
-def model_supports_tools(model: str) -> bool:
-    return "tools" in _capabilities_for_model(model)
+def _capabilities_for_model(model: str, digest: Optional[str]) -> set[str]:
+    cached = _CAPS_CACHE.get(model, digest)
+    if cached is not None:
+        return cached
+    failure = _recent_failure(model)
+    if failure is not None:
+        raise failure
+    import ollama
+
+    try:
+        response = ollama.show(model)
+    except Exception as exc:  # noqa: BLE001
+        raise _metadata_error(model, exc) from exc
+    return _store_capabilities(model, digest, response)
+
+
+def _known_support(model: str, digest: Optional[str]) -> Optional[bool]:
+    if digest is None:
+        return _TOOLS_SUPPORT_BY_NAME.get(model)
+    return _TOOLS_SUPPORT_CACHE.get((model, digest))
+
+
+def _remember_support(model: str, digest: Optional[str], supported: bool) -> None:
+    if digest is not None:
+        _TOOLS_SUPPORT_CACHE[(model, digest)] = supported
+    _TOOLS_SUPPORT_BY_NAME[model] = supported
+
+
+def model_supports_tools(model: str, digest: Optional[str] = None) -> bool:
+    """Return whether ``model`` has the tools capability.
+
+    ``digest`` is the model's digest from the server listing. Without one,
+    the last answer seen for ``model`` in this process is reused, and a
+    first check probes the server without touching the cache file.
+    """
+    supported = _known_support(model, digest)
+    if supported is None:
+        supported = "tools" in _capabilities_for_model(model, digest)
+        _remember_support(model, digest, supported)
+    return supported
+
+
+def _no_tools_error(model: str) -> ModelCapabilityError:
+    return ModelCapabilityError(
+        f"Model '{model}' does not allow tool usage (requires 'tools' capability)."
+    )
 
 
 def ensure_model_supports_tools(model: str) -> None:
     if not model_supports_tools(model):
-        raise ModelCapabilityError(
-            f"Model '{model}' does not allow tool usage (requires 'tools' capability)."
-        )
+        raise _no_tools_error(model)
 
 
-def get_tool_compatible_models(preferred: str | None = None) -> list[str]:
+def _cached_listing() -> Optional[list[Any]]:
+    """Return the model listing if it is younger than ``_LIST_TTL`` seconds."""
+    if _LIST_CACHE is not None and time.monotonic() - _LIST_CACHE[0] < _LIST_TTL:
+        return _LIST_CACHE[1]
+    return None
+
+
+def _store_listing(response: Any) -> list[Any]:
+    global _LIST_CACHE
+    models = list(response.models or ())
+    _LIST_CACHE = (time.monotonic(), models)
+    return models
+
+
+def _list_models_cached() -> list[Any]:
+    """Return the server's model listing, reusing it for ``_LIST_TTL`` seconds."""
+    models = _cached_listing()
+    if models is not None:
+        return models
+    import ollama
+
     try:
-        response = ollama.list()
-        models = getattr(response, "models", [])
+        return _store_listing(ollama.list())
     except Exception as exc:  # noqa: BLE001
         raise ModelCapabilityError(
             f"Failed to list models: {exc}"
         ) from exc
 
-    names: list[str] = []
-    seen: set[str] = set()
+
+def invalidate_model_caches() -> None:
+    """Forget cached model listings and capabilities (e.g. after a pull)."""
+    global _LIST_CACHE
+    _LIST_CACHE = None
+    _TOOLS_SUPPORT_CACHE.clear()
+    _TOOLS_SUPPORT_BY_NAME.clear()
+    _FAILED_PROBES.clear()
+    _CAPS_CACHE.clear()
+
+
+def _listed_models(models: Iterable[Any]) -> dict[str, Optional[str]]:
+    """Map the unique model names of a listing to their digests, in order."""
+    listed: dict[str, Optional[str]] = {}
     for item in models:
-        name = getattr(item, "model", None)
-        if not name or name in seen:
-            continue
-        seen.add(name)
         try:
-            if model_supports_tools(name):
-                names.append(name)
-        except ModelCapabilityError as exc:
-            logger.warning("Skipping model '%s': %s", name, exc)
+            name = _model_name(item)
+        except AttributeError:
+            continue
+        if name:
+            # A model may appear under several entries; keep the first.
+            listed.setdefault(name, getattr(item, "digest", None) or None)
+    return listed
+
+
+def _probe_tools(name: str, digest: Optional[str]) -> bool:
+    """Return whether ``name`` supports tools, logging and skipping failures."""
+    try:
+        return model_supports_tools(name, digest)
+    except ModelCapabilityError as exc:
+        logger.warning("Skipping model '%s': %s", name, exc)
+        return False
+
+
+def get_tool_compatible_models(preferred: str | None = None) -> list[str]:
+    listed = _listed_models(_list_models_cached())
+
+    # Each uncached probe is a blocking HTTP round-trip; overlap them and
+    # save whatever they learn in one write.
+    with _CAPS_CACHE.batch():
+        if len(listed) > 1:
+            workers = min(_PROBE_WORKERS, len(listed))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                supported = list(executor.map(
+                    _probe_tools, listed.keys(), listed.values()))
+        else:
+            supported = [_probe_tools(*entry) for entry in listed.items()]
+    names = [name for name, ok in zip(listed, supported) if ok]
 
     if preferred:
         ensure_model_supports_tools(preferred)
@@ -87,38 +354,161 @@ def get_tool_compatible_models(preferred: str | None = None) -> list[str]:
     return names
 
 
+def _warm_capabilities() -> None:
+    try:
+        listed = _listed_models(_list_models_cached())
+        # Failures stay inside their futures; nothing here is required.
+        with _CAPS_CACHE.batch(), \
+                ThreadPoolExecutor(max_workers=_PREFETCH_WORKERS) as executor:
+            for name, digest in listed.items():
+                executor.submit(model_supports_tools, name, digest)
+    except Exception as exc:  # noqa: BLE001
+        logger.debug("Capability prefetch failed: %s", exc)
+
+
+def prefetch_model_capabilities() -> threading.Thread:
+    """Warm the model listing and capability caches on a daemon thread.
+
+    Best effort: a later ``get_tool_compatible_models`` call finds the
+    probes already done instead of waiting on each ``ollama.show()``.
+    """
+    thread = threading.Thread(
+        target=_warm_capabilities, name="ollama-capability-prefetch",
+        daemon=True)
+    thread.start()
+    return thread
+
+
+async def _amodel_supports_tools(
+    client: Any, model: str, digest: Optional[str]
+) -> bool:
+    supported = _known_support(model, digest)
+    if supported is not None:
+        return supported
+    capabilities = _CAPS_CACHE.get(model, digest)
+    if capabilities is None:
+        failure = _recent_failure(model)
+        if failure is not None:
+            raise failure
+        try:
+            response = await client.show(model)
+        except Exception as exc:  # noqa: BLE001
+            raise _metadata_error(model, exc) from exc
+        capabilities = _store_capabilities(model, digest, response)
+    supported = "tools" in capabilities
+    _remember_support(model, digest, supported)
+    return supported
+
+
+async def _aprobe_tools(
+    client: Any, semaphore: asyncio.Semaphore, name: str, digest: Optional[str]
+) -> bool:
+    try:
+        async with semaphore:
+            return await _amodel_supports_tools(client, name, digest)
+    except ModelCapabilityError as exc:
+        logger.warning("Skipping model '%s': %s", name, exc)
+        return False
+
+
+async def aget_tool_compatible_models(preferred: str | None = None) -> list[str]:
+    """Async ``get_tool_compatible_models``; probes run concurrently on one client.
+
+    Shares the listing and capability caches with the synchronous version;
+    the cache file is read and written on a worker thread.
+    """
+    import ollama
+
+    async with ollama.AsyncClient() as client:
+        models = _cached_listing()
+        if models is None:
+            try:
+                models = _store_listing(await client.list())
+            except Exception as exc:  # noqa: BLE001
+                raise ModelCapabilityError(
+                    f"Failed to list models: {exc}"
+                ) from exc
+
+        listed = _listed_models(models)
+        await asyncio.to_thread(_CAPS_CACHE.load)
+        # Same concurrency cap as the thread pool of the sync version.
+        semaphore = asyncio.Semaphore(_PROBE_WORKERS)
+        _CAPS_CACHE.begin_batch()
+        try:
+            supported = await asyncio.gather(
+                *(_aprobe_tools(client, semaphore, name, digest)
+                  for name, digest in listed.items()))
+            names = [name for name, ok in zip(listed, supported) if ok]
+
+            if preferred:
+                digest = listed.get(preferred) or listed.get(f"{preferred}:latest")
+                if not await _amodel_supports_tools(client, preferred, digest):
+                    raise _no_tools_error(preferred)
+                if preferred not in names:
+                    names.insert(0, preferred)
+        finally:
+            await asyncio.to_thread(_CAPS_CACHE.end_batch)
+
+    return names
+
+
 def validate_reasoning_effort(effort: str) -> ReasoningEffortValue:
     """
     Validate and normalize reasoning effort value.
 
     Args:
-        effort: Effort level string to validate.
+        effort: Effort level string to validate; case and surrounding
+            whitespace are ignored.
 
     Returns:
         Valid reasoning effort value.
     """
-    if effort in ALLOWED_REASONING_EFFORTS:
-        return cast(ReasoningEffortValue, effort)
+    if isinstance(effort, str):
+        value = _EFFORT_MAP.get(effort) or _EFFORT_MAP.get(effort.strip().lower())
+        if value is not None:
+            return value
     logger.warning(
-        f"Invalid reasoning effort '{effort}', using default '{DEFAULT_REASONING_EFFORT}'")
+        "Invalid reasoning effort '%s', using default '%s'",
+        effort,
+        DEFAULT_REASONING_EFFORT,
+    )
     return DEFAULT_REASONING_EFFORT
 
 
 def extract_text(content: Any) -> str:
     """Best-effort conversion of agent payload content into plain text."""
-    if isinstance(content, str):
-        return content
+    # Walk nested lists with an explicit stack instead of recursing. Each
+    # list gets its own level of parts, joined and stripped when its end
+    # marker is popped, exactly as a recursive join would; a dict stands for
+    # its text or, failing that, its content.
+    levels: list[list[str]] = []
+    stack: list[Any] = [content]
+    while True:
+        item = stack.pop()
+        while isinstance(item, dict):
+            text_value = item.get("text")
+            if isinstance(text_value, str):
+                item = text_value
+                break
+            item = item.get("content")
 
-    if isinstance(content, list):
-        parts = [extract_text(item) for item in content]
-        return " ".join(part for part in parts if part).strip()
+        if item is _LIST_END:
+            text = " ".join(levels.pop()).strip()
+        elif isinstance(item, list):
+            levels.append([])
+            stack.append(_LIST_END)
+            stack.extend(reversed(item))
+            continue
+        elif isinstance(item, str):
+            text = item
+        else:
+            text = ""
 
-    if isinstance(content, dict):
-        text_value = content.get("text")
-        if isinstance(text_value, str):
-            return text_value
+        if not levels:
+            return text
+        if text:
+            levels[-1].append(text)
 
-        if "content" in content:
-            return extract_text(content["content"])
 
-    return ""
+if os.environ.get(_PREFETCH_ENV) == "1":
+    prefetch_model_capabilities()